@@ -6,12 +6,12 @@ This abstract class give the framework of how to run a convergence test on a giv
 The detail parameters for different properties are defined in the subclass that inherit this base class.
 """
 
-from typing import Union
+from typing import Any, Union
 from pathlib import Path
 from abc import ABCMeta, abstractmethod
 
 from aiida import orm
-from aiida.engine import append_
+from aiida.engine import append_, while_
 from aiida.engine import ProcessBuilder
 from aiida_pseudo.data.pseudo import UpfData
 
@@ -66,6 +66,14 @@ def is_valid_cutoff_list(cutoff_list, _=None):
         return "cutoff_list must be a list of tuples with increasing ecutrho"
 
 
+def is_valid_max_concurrent_evaluations(value, _=None):
+    """Check the maximum number of concurrent evaluations is a positive integer"""
+    if value.value < 1:
+        return (
+            f"max_concurrent_evaluations must be a positive integer, got {value.value}"
+        )
+
+
 class _BaseConvergenceWorkChain(SelfCleanWorkChain):
     """Base convergence workchain class for wavefunction cutoff convergence test.
     This is a abstract class and should be subclassed to implement the methods for specific convergence workflow.
@@ -107,14 +115,28 @@ class _BaseConvergenceWorkChain(SelfCleanWorkChain):
             validator=is_valid_convergence_configuration,
             help="The configuration to use for the workchain, can be DC/BCC/FCC/SC.",
         )
+        spec.input(
+            "max_concurrent_evaluations",
+            valid_type=orm.Int,
+            serializer=orm.to_aiida_type,
+            required=False,
+            validator=is_valid_max_concurrent_evaluations,
+            help="The maximum number of convergence evaluations submitted at the same time. "
+            "The cutoffs are run in batches of this size, a batch is submitted after the previous one finished. "
+            "The reference evaluation (and the extra reference of the pressure convergence) is submitted "
+            "together with the first batch and not counted in it. "
+            "If not set, all cutoffs are submitted at once.",
+        )
 
         spec.outline(
             cls._setup_pseudos,
             cls._setup_structure,
             cls._setup_protocol,
-            cls.run_reference,
+            cls.run_evaluations,
+            while_(cls.should_run_convergence)(
+                cls.run_convergence,
+            ),
             cls.inspect_reference,
-            cls.run_convergence,
             cls.inspect_convergence,
             cls._finalize,
         )
@@ -243,11 +265,15 @@ class _BaseConvergenceWorkChain(SelfCleanWorkChain):
         cls,
         pseudo: Union[Path, UpfData],
         protocol: str,
-        cutoff_list: list,
+        cutoff_list: Union[list, orm.List],
         configuration: str | None = None,
         clean_workdir: bool = True,
     ) -> ProcessBuilder:
-        """Generate builder for the generic convergence workflow"""
+        """Generate builder for the generic convergence workflow
+
+        The `cutoff_list` can be passed as an `orm.List` so that the same node is shared
+        by several convergence workflows instead of creating a new node for each of them.
+        """
         builder = super().get_builder()
         builder.protocol = orm.Str(protocol)
 
@@ -278,7 +304,10 @@ class _BaseConvergenceWorkChain(SelfCleanWorkChain):
         if ret := is_valid_cutoff_list(cutoff_list):
             raise ValueError(ret)
 
-        builder.cutoff_list = orm.List(list=cutoff_list)
+        if isinstance(cutoff_list, orm.List):
+            builder.cutoff_list = cutoff_list
+        else:
+            builder.cutoff_list = orm.List(list=cutoff_list)
         builder.clean_workdir = orm.Bool(clean_workdir)
 
         return builder
@@ -330,6 +359,22 @@ class _BaseConvergenceWorkChain(SelfCleanWorkChain):
             ),
         }
 
+    def run_evaluations(self):
+        """Submit the reference and the convergence evaluations in the same step
+
+        The evaluations at different cutoffs are independent, only the analysis of the
+        convergence needs the reference result. Submitting all of them together avoids
+        waiting for the reference to finish before the other cutoffs start to run.
+        """
+        # The last one is reference
+        self.ctx.convergence_cutoffs = [
+            (round(ecutwfc), round(ecutrho))
+            for ecutwfc, ecutrho in self.inputs.cutoff_list[:-1]
+        ]
+
+        self.run_reference()
+        self.run_convergence()
+
     def run_reference(self):
         """Run the reference calculation on the highest cutoff pair in the list
 
@@ -359,7 +404,13 @@ class _BaseConvergenceWorkChain(SelfCleanWorkChain):
     def inspect_reference(self):
         """Inspect the reference calculation and check if it is finished successfully.
 
-        It may also need to be overrided if additional calculations are run for reference.
+        It may also need to be overrided if additional calculations are run for reference,
+        the override must return the exit code returned by `super().inspect_reference()`.
+
+        The reference is submitted together with the convergence evaluations (see `run_evaluations`),
+        so when it fails the evaluations already submitted with it have run anyway.
+        The batches not yet submitted when `max_concurrent_evaluations` is set are skipped,
+        see `should_run_convergence`. The workchain still exits with `ERROR_REFERENCE_CALCULATION_FAILED` from here.
         """
         try:
             workchain = self.ctx.reference
@@ -374,22 +425,62 @@ class _BaseConvergenceWorkChain(SelfCleanWorkChain):
             # continued for other cutoff, and the results can still get to be analyzed.
             # A typical example is in EOS calculation, the birch murnaghan fit is failed (exit_code=1701),
             # but the EOS convergence can still be analyzed with energy-volume pairs.
-            if workchain.exit_code.status < 1000:
+            # The exit status is None if the reference excepted or was killed.
+            if workchain.exit_status is None or workchain.exit_status < 1000:
                 return self.exit_codes.ERROR_REFERENCE_CALCULATION_FAILED
 
+    def _is_reference_failed(self) -> bool:
+        """Whether the reference failed so that the convergence can not be analyzed,
+        exit status > 1000 is only a warning (see `inspect_reference`).
+
+        It should be overrided together with `inspect_reference` if additional calculations are run for reference.
+        """
+        workchain = self.ctx.reference
+        status = workchain.exit_status
+
+        return not workchain.is_finished_ok and (status is None or status < 1000)
+
+    def should_run_convergence(self):
+        """Whether there are still cutoffs in the queue to be evaluated.
+        The reference is finished after the first batch, the remaining batches are not
+        submitted if it failed.
+        """
+        if not self.ctx.convergence_cutoffs:
+            return False
+
+        if self._is_reference_failed():
+            self.report(
+                f"Reference evaluation failed, skip the remaining {len(self.ctx.convergence_cutoffs)} cutoffs."
+            )
+            return False
+
+        return True
+
     def run_convergence(self):
         """
-        run on all other evaluation sample points
+        run on the next batch of evaluation sample points, all the remaining points
+        if `max_concurrent_evaluations` is not set.
         """
-        for ecutwfc, ecutrho in self.inputs.cutoff_list[
-            :-1
-        ]:  # The last one is reference
-            ecutwfc, ecutrho = round(ecutwfc), round(ecutrho)
+        if "max_concurrent_evaluations" in self.inputs:
+            batch_size = self.inputs.max_concurrent_evaluations.value
+        else:
+            batch_size = len(self.ctx.convergence_cutoffs)
+
+        batch = self.ctx.convergence_cutoffs[:batch_size]
+        self.ctx.convergence_cutoffs = self.ctx.convergence_cutoffs[batch_size:]
+
+        # Prepare all the builders of the batch before submitting any of them,
+        # so the submissions are issued back to back in this step.
+        builders = []
+        for ecutwfc, ecutrho in batch:
             builder = self.prepare_evaluate_builder(ecutwfc=ecutwfc, ecutrho=ecutrho)
 
             # Add link to the called workchain by '{ecutwfc}_{ecutrho}'
             builder.metadata.call_link_label = f"cutoffs_{ecutwfc}_{ecutrho}"
 
+            builders.append((ecutwfc, ecutrho, builder))
+
+        for ecutwfc, ecutrho, builder in builders:
             running = self.submit(builder)
             self.report(
                 f"launching fix ecutrho={ecutrho} [ecutwfc={ecutwfc}] {running.process_label}<{running.pk}>"
@@ -483,3 +574,30 @@ class _BaseConvergenceWorkChain(SelfCleanWorkChain):
             return self.exit_codes.ERROR_NOT_ENOUGH_CONVERGENCE_TEST.format(rate=rate)
 
         self.out("success_rate", orm.Float(rate).store())
+
+
+def get_output_parameters_by_uuid(uuids: list[str], key: str) -> dict[str, Any]:
+    """Return the value of `key` in the `output_parameters` of the evaluation workchains
+    of the given UUIDs, as a mapping from the UUID to the value.
+
+    The values of all workchains are projected in one query, instead of loading
+    the output node of every workchain. The value is `None` if the workchain has no
+    `output_parameters` output or the output has no `key`.
+    """
+    query = (
+        orm.QueryBuilder()
+        .append(
+            orm.WorkChainNode,
+            filters={"uuid": {"in": list(uuids)}},
+            project="uuid",
+            tag="evaluate",
+        )
+        .append(
+            orm.Dict,
+            with_incoming="evaluate",
+            edge_filters={"label": "output_parameters"},
+            project=f"attributes.{key}",
+        )
+    )
+
+    return {uuid: None for uuid in uuids} | dict(query.all())
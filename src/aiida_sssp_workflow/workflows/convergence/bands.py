@@ -52,7 +52,7 @@ class ConvergenceBandsWorkChain(_BaseConvergenceWorkChain):
         cls,
         pseudo: Union[Path, UpfData],
         protocol: str,
-        cutoff_list: list,
+        cutoff_list: Union[list, orm.List],
         code: orm.AbstractCode,
         configuration: str | None = None,
         parallelization: dict | None = None,
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Union
 
 from aiida import orm
 from aiida.engine import ProcessBuilder
@@ -51,7 +52,7 @@ class _CachingConvergenceWorkChain(_BaseConvergenceWorkChain):
         cls,
         pseudo: Path,
         protocol: str,
-        cutoff_list: list,
+        cutoff_list: Union[list, orm.List],
         code: orm.AbstractCode,
         configuration: str | None = None,
         parallelization: dict | None = None,
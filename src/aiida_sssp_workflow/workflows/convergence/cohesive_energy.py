@@ -13,9 +13,13 @@ from aiida_pseudo.data.pseudo import UpfData
 from aiida_sssp_workflow.utils import get_default_mpi_options
 from aiida_sssp_workflow.utils.element import ACTINIDE_ELEMENTS, LANTHANIDE_ELEMENTS
 from aiida_sssp_workflow.workflows.convergence.report import ConvergenceReport
-from aiida_sssp_workflow.workflows.convergence._base import _BaseConvergenceWorkChain
+from aiida_sssp_workflow.workflows.convergence._base import (
+    _BaseConvergenceWorkChain,
+    get_output_parameters_by_uuid,
+)
 from aiida_sssp_workflow.workflows.evaluate._cohesive_energy import (
     CohesiveEnergyWorkChain,
+    create_isolate_atom,
 )
 
 
@@ -63,7 +67,7 @@ class ConvergenceCohesiveEnergyWorkChain(_BaseConvergenceWorkChain):
         cls,
         pseudo: Union[Path, UpfData],
         protocol: str,
-        cutoff_list: list,
+        cutoff_list: Union[list, orm.List],
         code: orm.AbstractCode,
         configuration: str | None = None,
         bulk_parallelization: dict | None = None,
@@ -101,11 +105,49 @@ class ConvergenceCohesiveEnergyWorkChain(_BaseConvergenceWorkChain):
 
         return builder
 
+    def _get_shared_evaluate_inputs(self) -> dict:
+        """Return the inputs of the evaluation that do not depend on the cutoffs.
+        They are created and stored once and the same nodes are passed to every evaluation,
+        rather than storing an identical node for each cutoff point.
+
+        They are kept as stored (not `non_db`) inputs since they define the result of the evaluation,
+        as the structure, pseudos, code and pw parameters do. The `metadata.options` are already not stored
+        and `clean_workdir` is the input node of this workchain passed through unchanged.
+        """
+        if "shared_evaluate_inputs" not in self.ctx:
+            protocol = self.protocol
+
+            atom_kpoints = orm.KpointsData()
+            atom_kpoints.set_kpoints_mesh([1, 1, 1])
+
+            vacuum_length = orm.Float(protocol["vacuum_length"]).store()
+
+            # The isolate atom structures only depend on the vacuum length, create them
+            # once here so every evaluation runs on the same structure nodes.
+            elements = dict.fromkeys(self.structure.get_ase().get_chemical_symbols())
+            atom_structures = {
+                element: create_isolate_atom(orm.Str(element), vacuum_length)
+                for element in elements
+            }
+
+            self.ctx.shared_evaluate_inputs = {
+                "vacuum_length": vacuum_length,
+                "atom_structures": atom_structures,
+                "bulk_kpoints_distance": orm.Float(
+                    protocol["kpoints_distance"]
+                ).store(),
+                "atom_kpoints": atom_kpoints.store(),
+            }
+
+        return self.ctx.shared_evaluate_inputs
+
     def prepare_evaluate_builder(self, ecutwfc, ecutrho) -> ProcessBuilder:
         """Input builder for running the inner EOS evaluation workchain"""
         protocol = self.protocol
         natoms = len(self.structure.sites)
 
+        shared_inputs = self._get_shared_evaluate_inputs()
+
         builder = self._EVALUATE_WORKCHAIN.get_builder()
 
         builder.clean_workdir = (
@@ -113,7 +155,8 @@ class ConvergenceCohesiveEnergyWorkChain(_BaseConvergenceWorkChain):
         )  # sync with the main workchain
         builder.pseudos = self.pseudos
         builder.structure = self.structure
-        builder.vacuum_length = orm.Float(protocol["vacuum_length"])
+        builder.vacuum_length = shared_inputs["vacuum_length"]
+        builder.atom_structures = shared_inputs["atom_structures"]
 
         # bulk
         bulk_pw_parameters = {
@@ -134,7 +177,7 @@ class ConvergenceCohesiveEnergyWorkChain(_BaseConvergenceWorkChain):
             },
         }
 
-        builder.bulk.kpoints_distance = orm.Float(protocol["kpoints_distance"])
+        builder.bulk.kpoints_distance = shared_inputs["bulk_kpoints_distance"]
         builder.bulk.metadata.call_link_label = "cohesive_bulk_scf"
         builder.bulk.pw["code"] = self.inputs.code
         builder.bulk.pw["parameters"] = orm.Dict(dict=bulk_pw_parameters)
@@ -167,10 +210,7 @@ class ConvergenceCohesiveEnergyWorkChain(_BaseConvergenceWorkChain):
         if self.element in LANTHANIDE_ELEMENTS + ACTINIDE_ELEMENTS:
             atom_pw_parameters["SYSTEM"]["nbnd"] = 5 * self.inputs.pseudo.z_valence
 
-        atom_kpoints = orm.KpointsData()
-        atom_kpoints.set_kpoints_mesh([1, 1, 1])
-
-        builder.atom.kpoints = atom_kpoints
+        builder.atom.kpoints = shared_inputs["atom_kpoints"]
         builder.atom.metadata.call_link_label = "cohesive_atom_scf"
         builder.atom.pw["code"] = self.inputs.code
         builder.atom.pw["parameters"] = orm.Dict(dict=atom_pw_parameters)
@@ -184,38 +224,40 @@ def compute_xy(
     node: orm.Node,
 ) -> dict[str, Any]:
     """From report calculate the xy data, xs are cutoffs and ys are cohesive energy diff from reference"""
+    import numpy as np
+
     report_dict = node.outputs.report.get_dict()
     report = ConvergenceReport.construct(**report_dict)
 
-    reference_node = orm.load_node(report.reference.uuid)
-    output_parameters_r: orm.Dict = reference_node.outputs.output_parameters
-    y_ref = output_parameters_r["cohesive_energy_per_atom"]
+    uuids = [report.reference.uuid] + [
+        node_point.uuid for node_point in report.convergence_list
+    ]
+    cohesive_energy_per_atom = get_output_parameters_by_uuid(
+        uuids, "cohesive_energy_per_atom"
+    )
 
-    xs = []
-    ys = []
-    ys_cohesive_energy_per_atom = []
-    for node_point in report.convergence_list:
-        if node_point.exit_status != 0:
-            # TODO: log to a warning file for where the node is not finished_okay
-            continue
+    y_ref = cohesive_energy_per_atom[report.reference.uuid]
 
-        x = node_point.wavefunction_cutoff
-        xs.append(x)
+    # TODO: log to a warning file for where the node is not finished_okay
+    success_points = [
+        node_point
+        for node_point in report.convergence_list
+        if node_point.exit_status == 0
+    ]
 
-        node = orm.load_node(node_point.uuid)
-        output_parameters_p: orm.Dict = node.outputs.output_parameters
+    xs = np.empty(len(success_points), dtype=int)
+    ys_cohesive_energy_per_atom = np.empty(len(success_points), dtype=float)
+    for i, node_point in enumerate(success_points):
+        xs[i] = node_point.wavefunction_cutoff
+        ys_cohesive_energy_per_atom[i] = cohesive_energy_per_atom[node_point.uuid]
 
-        y = (output_parameters_p["cohesive_energy_per_atom"] - y_ref) / y_ref * 100
-        ys.append(y)
-        ys_cohesive_energy_per_atom.append(
-            output_parameters_p["cohesive_energy_per_atom"]
-        )
+    ys = (ys_cohesive_energy_per_atom - y_ref) / y_ref * 100
 
     return {
-        "xs": xs,
-        "ys": ys,
-        "ys_relative_diff": ys,
-        "ys_cohesive_energy_per_atom": ys_cohesive_energy_per_atom,
+        "xs": xs.tolist(),
+        "ys": ys.tolist(),
+        "ys_relative_diff": ys.tolist(),
+        "ys_cohesive_energy_per_atom": ys_cohesive_energy_per_atom.tolist(),
         "metadata": {
             "unit": "%",
         },
@@ -49,7 +49,7 @@ class ConvergenceEOSWorkChain(_BaseConvergenceWorkChain):
         cls,
         pseudo: Union[Path, UpfData],
         protocol: str,
-        cutoff_list: list,
+        cutoff_list: Union[list, orm.List],
         code: orm.AbstractCode,
         configuration: str | None = None,
         parallelization: dict | None = None,
@@ -68,7 +68,7 @@ class ConvergencePhononFrequenciesWorkChain(_BaseConvergenceWorkChain):
         cls,
         pseudo: Union[Path, UpfData],
         protocol: str,
-        cutoff_list: list,
+        cutoff_list: Union[list, orm.List],
         pw_code: orm.AbstractCode,
         ph_code: orm.AbstractCode,
         configuration: str | None = None,
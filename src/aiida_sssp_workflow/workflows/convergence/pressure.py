@@ -3,6 +3,7 @@
 Convergence test on pressure of a given pseudopotential
 """
 
+import functools
 from pathlib import Path
 from typing import Union, Any
 
@@ -11,11 +12,17 @@ from aiida.engine import ProcessBuilder
 from aiida_pseudo.data.pseudo import UpfData
 
 from aiida_sssp_workflow.utils import get_default_mpi_options
-from aiida_sssp_workflow.workflows.convergence._base import _BaseConvergenceWorkChain
+from aiida_sssp_workflow.workflows.convergence._base import (
+    _BaseConvergenceWorkChain,
+    get_output_parameters_by_uuid,
+)
 from aiida_sssp_workflow.workflows.evaluate._eos import _EquationOfStateWorkChain
 from aiida_sssp_workflow.workflows.evaluate._pressure import PressureWorkChain
 from aiida_sssp_workflow.workflows.convergence.report import ConvergenceReport
 
+# 1 eV/angs^3 = 160.21766208 GPa, multiply by it to convert GPa to eV/angs^3
+_GPA_TO_EV_PER_ANGSTROM3 = 1.0 / 160.21766208
+
 
 class ConvergencePressureWorkChain(_BaseConvergenceWorkChain):
     """WorkChain to converge test on pressure of input structure"""
@@ -50,7 +57,7 @@ class ConvergencePressureWorkChain(_BaseConvergenceWorkChain):
         code: orm.AbstractCode,
         pseudo: Union[Path, UpfData],
         protocol: str,
-        cutoff_list: list,
+        cutoff_list: Union[list, orm.List],
         configuration: str | None = None,
         parallelization: dict | None = None,
         mpi_options: dict | None = None,
@@ -75,11 +82,24 @@ class ConvergencePressureWorkChain(_BaseConvergenceWorkChain):
 
         return builder
 
+    def _get_shared_evaluate_inputs(self) -> dict:
+        """Stored input nodes that are the same for all pressure evaluations and the reference EOS"""
+        if "shared_evaluate_inputs" not in self.ctx:
+            protocol = self.protocol
+
+            self.ctx.shared_evaluate_inputs = {
+                "kpoints_distance": orm.Float(protocol["kpoints_distance"]).store(),
+            }
+
+        return self.ctx.shared_evaluate_inputs
+
     def prepare_evaluate_builder(self, ecutwfc, ecutrho):
         """Prepare input builder for running the inner pressure evaluation workchain"""
         protocol = self.protocol
         natoms = len(self.structure.sites)
 
+        shared_inputs = self._get_shared_evaluate_inputs()
+
         builder = self._EVALUATE_WORKCHAIN.get_builder()
 
         builder.clean_workdir = (
@@ -107,7 +127,7 @@ class ConvergencePressureWorkChain(_BaseConvergenceWorkChain):
             },
         }
 
-        builder.kpoints_distance = orm.Float(protocol["kpoints_distance"])
+        builder.kpoints_distance = shared_inputs["kpoints_distance"]
         builder.metadata.call_link_label = "pressure_scf"
         builder.pw["code"] = self.inputs.code
         builder.pw["parameters"] = orm.Dict(dict=pw_parameters)
@@ -146,14 +166,16 @@ class ConvergencePressureWorkChain(_BaseConvergenceWorkChain):
             },
         }
 
+        shared_inputs = self._get_shared_evaluate_inputs()
+
         # EOS builder
         builder = _EquationOfStateWorkChain.get_builder()
 
         builder.metadata.call_link_label = "EOS_for_pressure_ref"
         builder.structure = self.structure
-        builder.kpoints_distance = orm.Float(protocol["kpoints_distance"])
-        builder.scale_count = orm.Int(protocol["scale_count"])
-        builder.scale_increment = orm.Float(protocol["scale_increment"])
+        builder.kpoints_distance = shared_inputs["kpoints_distance"]
+        builder.scale_count = protocol["scale_count"]
+        builder.scale_increment = protocol["scale_increment"]
 
         # pw
         builder.pw["code"] = self.inputs.code
@@ -169,11 +191,19 @@ class ConvergencePressureWorkChain(_BaseConvergenceWorkChain):
 
         self.to_context(extra_reference=running)
 
+    def _is_reference_failed(self) -> bool:
+        """The EOS of extra reference is needed as well to compute the residual volume"""
+        return (
+            super()._is_reference_failed()
+            or not self.ctx.extra_reference.is_finished_ok
+        )
+
     def inspect_reference(self):
         """After doing the regular inspect to get the pressure results, also parse the extra reference
         compute for EOS at reference in order to get data for residual data compute.
         """
-        super().inspect_reference()
+        if exit_code := super().inspect_reference():
+            return exit_code
 
         workchain = self.ctx.extra_reference
         if not workchain.is_finished_ok:
@@ -199,12 +229,83 @@ class ConvergencePressureWorkChain(_BaseConvergenceWorkChain):
         }
 
 
+def _birch_murnaghan_polynomials(B1):
+    """
+    Coefficients of the polynomial in x=(V0/V)^(1/3) (aside from the
+    constant multiplicative factor 3B0/2) with the pressure dependent constant term left to zero.
+
+    It comes from expanding P(x) = 3B0/2 (x^7 - x^5) (1 + 3/4 (B1 - 4) (x^2 - 1)),
+    i.e. a*x^9 + b*x^7 + c*x^5 + d. The powers are mixed odd powers, the polynomial
+    can not be reduced to a cubic in x^3 (or in x^2), so the full degree 9 is solved.
+
+    B1 can be an array, the coefficients are then along the last axis.
+    """
+    import numpy as np
+
+    B1 = np.asarray(B1, dtype=float)
+
+    polynomials = np.zeros(B1.shape + (10,))
+    polynomials[..., 0] = 3.0 / 4.0 * (B1 - 4.0)
+    polynomials[..., 2] = 1.0 - 3.0 / 2.0 * (B1 - 4.0)
+    polynomials[..., 4] = 3.0 / 4.0 * (B1 - 4.0) - 1.0
+
+    return polynomials
+
+
+@functools.lru_cache(maxsize=8)
+def _birch_murnaghan_polynomial(B1):
+    """
+    The Birch-Murnaghan polynomial of a single B1, see `_birch_murnaghan_polynomials`.
+
+    It only depends on B1 which is fixed for a convergence test, so it is cached.
+    The returned array is read-only since it is shared by the callers.
+    """
+    polynomial = _birch_murnaghan_polynomials(B1)
+    polynomial.flags.writeable = False
+
+    return polynomial
+
+
+def _closest_volumes_from_polynomials(polynomials, V0):
+    """
+    For each row of `polynomials` (with non-zero leading coefficient) get the volume
+    V0/x^3 of the real root x the closest to V0.
+
+    The roots are eigenvalues of the companion matrices in the same form as `np.roots` uses,
+    stacked for all rows and solved by one `np.linalg.eigvals` call.
+    """
+    import numpy as np
+
+    size, degree = polynomials.shape[0], polynomials.shape[1] - 1
+    companion = np.zeros((size, degree, degree))
+    companion[:, 1:, :-1] = np.eye(degree - 1)
+    companion[:, 0, :] = -polynomials[:, 1:] / polynomials[:, :1]
+
+    roots = np.linalg.eigvals(companion)
+    is_real = np.abs(roots.imag) < 1e-8 * np.abs(roots.real)
+
+    with np.errstate(divide="ignore"):
+        volumes = V0[:, np.newaxis] / roots.real**3
+    closest = np.argmin(
+        np.where(is_real, np.abs(volumes - V0[:, np.newaxis]), np.inf), axis=1
+    )
+
+    return volumes[np.arange(size), closest]
+
+
 def _helper_get_volume_from_pressure_birch_murnaghan(P, V0, B0, B1):
     """
     Knowing the pressure P and the Birch-Murnaghan equation of state
     parameters, gets the volume the closest to V0 (relatively) that is
     such that P_BirchMurnaghan(V)=P
 
+    P, V0, B0 and B1 can be scalars or arrays broadcastable to each other, e.g.
+    many pressures against one EOS fit, or samples of many pseudopotentials.
+    The polynomials of all samples are solved together.
+
+    For B1=4 (second order Birch-Murnaghan) the x^9 coefficient vanishes and
+    the degree 7 polynomial is solved instead, as `np.roots` does by trimming the leading zero.
+
     retrun unit is (%)
 
     !! The unit of P and B0 must be compatible. We use eV/angs^3 here.
@@ -212,33 +313,43 @@ def _helper_get_volume_from_pressure_birch_murnaghan(P, V0, B0, B1):
     """
     import numpy as np
 
+    if np.ndim(B1) == 0:
+        polynomials = _birch_murnaghan_polynomial(float(B1))
+    else:
+        polynomials = _birch_murnaghan_polynomials(B1)
+
+    P, V0, B0, B1 = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (P, V0, B0, B1))
+    )
+    shape = P.shape
+    size = P.size
+    V0 = V0.ravel()
+
     # convert P from GPa to eV/angs^3
-    P = P / 160.21766208
-
-    # coefficients of the polynomial in x=(V0/V)^(1/3) (aside from the
-    # constant multiplicative factor 3B0/2)
-    polynomial = [
-        3.0 / 4.0 * (B1 - 4.0),
-        0,
-        1.0 - 3.0 / 2.0 * (B1 - 4.0),
-        0,
-        3.0 / 4.0 * (B1 - 4.0) - 1.0,
-        0,
-        0,
-        0,
-        0,
-        -2 * P / (3.0 * B0),
-    ]
-    V = min(
-        [
-            V0 / (x.real**3)
-            for x in np.roots(polynomial)
-            if abs(x.imag) < 1e-8 * abs(x.real)
-        ],
-        key=lambda V: abs(V - V0) / float(V0),
+    P = P.ravel() * _GPA_TO_EV_PER_ANGSTROM3
+
+    # one row of coefficients per sample, the constant term -2P/(3B0) is the only
+    # pressure dependent one
+    polynomials = np.array(
+        np.broadcast_to(polynomials, shape + (10,)).reshape(size, 10)
     )
+    polynomials[:, -1] = P * (-2.0 / (3.0 * B0.ravel()))
+
+    V = np.empty(size)
+    is_degree_9 = polynomials[:, 0] != 0
+    if is_degree_9.any():
+        V[is_degree_9] = _closest_volumes_from_polynomials(
+            polynomials[is_degree_9], V0[is_degree_9]
+        )
+    if not is_degree_9.all():
+        # the x^8 coefficient is always zero, the polynomial starts from x^7
+        V[~is_degree_9] = _closest_volumes_from_polynomials(
+            polynomials[~is_degree_9, 2:], V0[~is_degree_9]
+        )
+
+    relative_diff = np.abs(V - V0) / V0 * 100
 
-    return abs(V - V0) / V0 * 100
+    return relative_diff.reshape(shape) if shape else float(relative_diff[0])
 
 
 def compute_xy(
@@ -256,12 +367,15 @@ def compute_xy(
     report_dict = node.outputs.report.get_dict()
     report = ConvergenceReport.construct(**report_dict)
 
-    reference_node = orm.load_node(report.reference.uuid)
-    output_parameters_r: orm.Dict = reference_node.outputs.output_parameters
-    y_ref = output_parameters_r["hydrostatic_stress"]
+    uuids = [report.reference.uuid] + [
+        node_point.uuid for node_point in report.convergence_list
+    ]
+    hydrostatic_stress = get_output_parameters_by_uuid(uuids, "hydrostatic_stress")
+
+    y_ref = hydrostatic_stress[report.reference.uuid]
 
     xs = []
-    ys = []
+    diffs = []
     for node_point in report.convergence_list:
         if node_point.exit_status != 0:
             # TODO: log to a warning file for where the node is not finished_okay
@@ -270,26 +384,22 @@ def compute_xy(
         x = node_point.wavefunction_cutoff
         xs.append(x)
 
-        node = orm.load_node(node_point.uuid)
-        output_parameters_p: orm.Dict = node.outputs.output_parameters
-
-        y_p = output_parameters_p["hydrostatic_stress"]
+        y_p = hydrostatic_stress[node_point.uuid]
 
         # calculate the diff
-        diff = y_p - y_ref
-        relative_diff = _helper_get_volume_from_pressure_birch_murnaghan(
-            diff,
-            V0,
-            B0,
-            B1,
-        )
-
-        y = relative_diff
-        ys.append(y)
+        diffs.append(y_p - y_ref)
+
+    # solve the residual volume for all points at once
+    ys = _helper_get_volume_from_pressure_birch_murnaghan(
+        diffs,
+        V0,
+        B0,
+        B1,
+    )
 
     return {
         "xs": xs,
-        "ys": ys,
+        "ys": ys.tolist(),
         "metadata": {
             "unit": "%",
         },
@@ -47,6 +47,48 @@ def create_isolate_atom(
     return structure
 
 
+def get_isolate_atom_structures(
+    elements: list, vacuum_length: orm.Float, atom_structures: dict
+) -> dict:
+    """
+    Return the isolate atom structure of each element, take it from `atom_structures`
+    if it is there, otherwise create it by `create_isolate_atom` with the `vacuum_length`.
+    """
+    dict_element_and_structure = {}
+    for element in elements:
+        if element in atom_structures:
+            atom_structure = atom_structures[element]
+        else:
+            atom_structure = create_isolate_atom(orm.Str(element), vacuum_length)
+        dict_element_and_structure[element] = atom_structure
+
+    return dict_element_and_structure
+
+
+def validate_inputs(inputs, ctx=None):
+    """Validate the inputs of the entire input namespace"""
+    atom_structures = inputs.get("atom_structures", {})
+    if not atom_structures or "vacuum_length" not in inputs:
+        return
+
+    # The given isolate atom structures must be the ones `create_isolate_atom` would create
+    L = inputs["vacuum_length"].value  # pylint: disable=invalid-name
+    for element, structure in atom_structures.items():
+        is_single_atom = (
+            structure.get_kind_names() == [element] and len(structure.sites) == 1
+        )
+        is_cubic_cell = all(
+            abs(structure.cell[i][j] - (L if i == j else 0.0)) < 1e-8
+            for i in range(3)
+            for j in range(3)
+        )
+        if not (is_single_atom and is_cubic_cell):
+            return (
+                f"The isolate atom structure of {element} is not a single {element} atom "
+                f"in a cubic cell of vacuum_length={L}."
+            )
+
+
 class PwBaseWorkChainWithMemoryHandler(PwBaseWorkChain):
     """Add memory handler to PwBaseWorkChain to use large memory resource"""
 
@@ -123,10 +165,14 @@ class CohesiveEnergyWorkChain(_BaseEvaluateWorkChain):
                     help='Ground state structure which the verification perform')
         spec.input_namespace('pseudos', valid_type=UpfData, dynamic=True,
                     help='A mapping of `UpfData` nodes onto the kind name to which they should apply.')
-        spec.input('vacuum_length', valid_type=orm.Float,
+        spec.input('vacuum_length', valid_type=orm.Float, serializer=orm.to_aiida_type,
                     help='The length of cubic cell in isolate atom calculation.')
+        spec.input_namespace('atom_structures', valid_type=orm.StructureData, dynamic=True, required=False,
+                    help='Isolate atom structures mapped onto the element, created from `vacuum_length` if not given. '
+                    'They must be cubic cells of `vacuum_length` with the single atom, as `create_isolate_atom` creates.')
         spec.expose_inputs(PwBaseWorkChain, namespace="bulk", exclude=["pw.structure", "pw.pseudos"])
         spec.expose_inputs(PwBaseWorkChainWithMemoryHandler, namespace="atom", exclude=["pw.structure", "pw.pseudos"])
+        spec.inputs.validator = validate_inputs
 
         spec.outline(
             cls.validate_structure,
@@ -153,12 +199,13 @@ class CohesiveEnergyWorkChain(_BaseEvaluateWorkChain):
         }
 
         # assert len(self.inputs.pseudos) == len(dict_element_and_count)
-        dict_element_and_structure = {}
-        for element in elements:
-            atom_structure = create_isolate_atom(
-                orm.Str(element), self.inputs.vacuum_length
-            )
-            dict_element_and_structure[element] = atom_structure
+        # reuse the isolate atom structures passed in, e.g. from a convergence test where
+        # they are the same for every cutoff, only create the missing ones
+        dict_element_and_structure = get_isolate_atom_structures(
+            elements,
+            self.inputs.vacuum_length,
+            self.inputs.get("atom_structures", {}),
+        )
 
         self.ctx.pseudos = self.inputs.pseudos
         self.ctx.d_element_structure = dict_element_and_structure
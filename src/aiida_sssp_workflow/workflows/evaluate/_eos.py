@@ -35,6 +35,7 @@ class _EquationOfStateWorkChain(WorkChain):
         spec.input(
             "kpoints_distance",
             valid_type=orm.Float,
+            serializer=orm.to_aiida_type,
             required=True,
             help="The kpoints distance used in generating the kmesh of unscaled structure then for all scaled structures",
         )
@@ -47,12 +48,14 @@ class _EquationOfStateWorkChain(WorkChain):
         spec.input(
             "scale_count",
             valid_type=orm.Int,
+            serializer=orm.to_aiida_type,
             default=lambda: orm.Int(7),
             help="The number of points to compute for the equation of state.",
         )
         spec.input(
             "scale_increment",
             valid_type=orm.Float,
+            serializer=orm.to_aiida_type,
             default=lambda: orm.Float(0.02),
             help="The relative difference between consecutive scaling factors.",
         )
@@ -258,8 +258,13 @@ class FullVerificationWorkChain(SelfCleanWorkChain):
             "test": "test",
         }
 
-        cutoff_list = generate_cutoff_list(
-            mapping_to_control[protocol], self.ctx.element, self.ctx.pp_type
+        # The same cutoff list node is used by all convergence workflows. It is not stored here,
+        # the engine stores it with the other nodes of the builders in the context once,
+        # also for a dry run, and the submissions all reuse this node.
+        cutoff_list = orm.List(
+            list=generate_cutoff_list(
+                mapping_to_control[protocol], self.ctx.element, self.ctx.pp_type
+            )
         )
 
         builders = {}
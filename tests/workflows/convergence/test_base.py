@@ -2,12 +2,142 @@ import pytest
 
 from aiida import orm
 from aiida.plugins import DataFactory, WorkflowFactory
-from aiida.engine import ProcessBuilder, run_get_node
+from aiida.engine import ProcessBuilder, WorkChain, calcfunction, run_get_node
 
+from aiida.common.links import LinkType
+
+from aiida_sssp_workflow.workflows.convergence._base import (
+    _BaseConvergenceWorkChain,
+    get_output_parameters_by_uuid,
+)
 from aiida_sssp_workflow.workflows.convergence.report import ConvergenceReport
 
 UpfData = DataFactory("pseudo.upf")
 
+CUTOFF_LIST = [(20, 80), (25, 100), (30, 120), (35, 140), (40, 160)]
+
+
+@calcfunction
+def _dummy_output_parameters(ecutwfc):
+    return orm.Dict({"ecutwfc": ecutwfc.value})
+
+
+class _DummyEvaluateWorkChain(WorkChain):
+    """Evaluation that runs no calculation, it fails if `fail` is set"""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.input("ecutwfc", valid_type=orm.Int)
+        spec.input("fail", valid_type=orm.Bool, default=lambda: orm.Bool(False))
+        spec.input("excepted", valid_type=orm.Bool, default=lambda: orm.Bool(False))
+        spec.outline(cls.evaluate)
+        spec.output("output_parameters", valid_type=orm.Dict)
+        spec.exit_code(300, "ERROR_DUMMY", message="The dummy evaluation failed.")
+
+    def evaluate(self):
+        if self.inputs.excepted:
+            raise RuntimeError("The dummy evaluation excepted.")
+
+        if self.inputs.fail:
+            return self.exit_codes.ERROR_DUMMY
+
+        self.out("output_parameters", _dummy_output_parameters(self.inputs.ecutwfc))
+
+
+class _DummyConvergenceWorkChain(_BaseConvergenceWorkChain):
+    """Convergence workchain running the dummy evaluation"""
+
+    _PROPERTY_NAME = "caching"
+    _EVALUATE_WORKCHAIN = _DummyEvaluateWorkChain
+    _FAIL_REFERENCE = False
+    _EXCEPT_REFERENCE = False
+
+    def prepare_evaluate_builder(self, ecutwfc, ecutrho):
+        is_reference = [ecutwfc, ecutrho] == list(self.inputs.cutoff_list[-1])
+
+        builder = self._EVALUATE_WORKCHAIN.get_builder()
+        builder.ecutwfc = ecutwfc
+        builder.fail = self._FAIL_REFERENCE and is_reference
+        builder.excepted = self._EXCEPT_REFERENCE and is_reference
+
+        return builder
+
+    def run_convergence(self):
+        """Record in the extras the size of every batch and whether the
+        evaluations of the previous batches were finished when it was submitted."""
+        previous = list(self.ctx.get("children_convergence", []))
+        num_cutoffs = len(self.ctx.convergence_cutoffs)
+
+        super().run_convergence()
+
+        extras = self.node.base.extras
+        extras.set(
+            "batch_sizes",
+            extras.get("batch_sizes", [])
+            + [num_cutoffs - len(self.ctx.convergence_cutoffs)],
+        )
+        extras.set(
+            "previous_finished",
+            extras.get("previous_finished", [])
+            + [all(child.is_terminated for child in previous)],
+        )
+
+
+class _DummyFailedReferenceConvergenceWorkChain(_DummyConvergenceWorkChain):
+    """Convergence workchain where the dummy evaluation of the reference fails"""
+
+    _FAIL_REFERENCE = True
+
+
+class _DummyExceptedReferenceConvergenceWorkChain(_DummyConvergenceWorkChain):
+    """Convergence workchain where the dummy evaluation of the reference excepted"""
+
+    _EXCEPT_REFERENCE = True
+
+
+class _DummyExtraReferenceConvergenceWorkChain(
+    _DummyFailedReferenceConvergenceWorkChain
+):
+    """Convergence workchain running an extra reference next to the failing reference,
+    its overrides call `super()` in the same way as the pressure convergence."""
+
+    def run_reference(self):
+        super().run_reference()
+
+        builder = self._EVALUATE_WORKCHAIN.get_builder()
+        builder.ecutwfc = self.inputs.cutoff_list[-1][0]
+        self.to_context(extra_reference=self.submit(builder))
+
+    def _is_reference_failed(self) -> bool:
+        return (
+            super()._is_reference_failed()
+            or not self.ctx.extra_reference.is_finished_ok
+        )
+
+    def inspect_reference(self):
+        if exit_code := super().inspect_reference():
+            return exit_code
+
+        if not self.ctx.extra_reference.is_finished_ok:
+            return self.exit_codes.ERROR_SUB_PROCESS_FAILED.format(
+                label="extra_reference"
+            )
+
+
+def _run_dummy_convergence(process_class, pseudo_path, **kwargs):
+    builder = process_class.get_builder(
+        pseudo=pseudo_path(),
+        protocol="test",
+        cutoff_list=CUTOFF_LIST,
+        configuration="DC",
+        clean_workdir=False,
+    )
+    for key, value in kwargs.items():
+        setattr(builder, key, value)
+
+    return run_get_node(builder)
+
 
 @pytest.mark.slow
 @pytest.mark.parametrize(
@@ -109,5 +239,124 @@ def test_builder_pseudo_as_upfdata(
     data_regression.check(serialize_builder(builder))
 
 
+def _generate_evaluate_node(outputs: dict):
+    """Return a stored WorkChainNode returning the given Dict outputs."""
+    node = orm.WorkChainNode().store()
+    for link_label, output in outputs.items():
+        output = orm.Dict(output).store()
+        output.base.links.add_incoming(
+            node, link_type=LinkType.RETURN, link_label=link_label
+        )
+
+    return node
+
+
+@pytest.mark.usefixtures("aiida_profile")
+def test_get_output_parameters_by_uuid():
+    """Test the value is projected from the `output_parameters` output only
+    and `None` is returned if the output or the key is missing."""
+    with_key = _generate_evaluate_node(
+        {
+            "output_parameters": {"energy": 1.0},
+            "other_output": {"energy": 2.0},
+        }
+    )
+    without_key = _generate_evaluate_node({"output_parameters": {"stress": 3.0}})
+    without_output = _generate_evaluate_node({"other_output": {"energy": 4.0}})
+
+    uuids = [with_key.uuid, without_key.uuid, without_output.uuid]
+
+    assert get_output_parameters_by_uuid(uuids, "energy") == {
+        with_key.uuid: 1.0,
+        without_key.uuid: None,
+        without_output.uuid: None,
+    }
+
+
+@pytest.mark.usefixtures("aiida_profile")
+def test_failed_reference(pseudo_path):
+    """Test the workchain exits with 401 if the reference failed, the convergence
+    evaluations submitted together with the reference have run anyway."""
+    _, node = _run_dummy_convergence(
+        _DummyFailedReferenceConvergenceWorkChain, pseudo_path
+    )
+
+    assert (
+        node.exit_status
+        == _DummyConvergenceWorkChain.exit_codes.ERROR_REFERENCE_CALCULATION_FAILED.status
+    )
+
+    evaluations = node.base.links.get_outgoing(node_class=orm.WorkChainNode).all_nodes()
+    assert len(evaluations) == len(CUTOFF_LIST)
+
+
+@pytest.mark.usefixtures("aiida_profile")
+@pytest.mark.parametrize(
+    "max_concurrent_evaluations,batch_sizes",
+    [
+        (None, [4]),
+        (1, [1, 1, 1, 1]),
+        (2, [2, 2]),
+        (3, [3, 1]),
+    ],
+)
+def test_max_concurrent_evaluations(
+    pseudo_path, max_concurrent_evaluations, batch_sizes
+):
+    """Test the convergence evaluations are run in batches, each batch submitted after
+    the previous one finished, and the report lists all cutoffs in order."""
+    inputs = {}
+    if max_concurrent_evaluations is not None:
+        inputs["max_concurrent_evaluations"] = max_concurrent_evaluations
+
+    result, node = _run_dummy_convergence(
+        _DummyConvergenceWorkChain, pseudo_path, **inputs
+    )
+
+    assert node.is_finished_ok
+    assert result["success_rate"].value == 1.0
+
+    assert node.base.extras.get("batch_sizes") == batch_sizes
+    assert all(node.base.extras.get("previous_finished"))
+
+    report = ConvergenceReport.construct(**result["report"])
+    assert [
+        (point.wavefunction_cutoff, point.charge_density_cutoff)
+        for point in report.convergence_list
+    ] == CUTOFF_LIST
+    assert report.reference == report.convergence_list[-1]
+
+
+@pytest.mark.usefixtures("aiida_profile")
+@pytest.mark.parametrize(
+    "process_class,num_references",
+    [
+        (_DummyFailedReferenceConvergenceWorkChain, 1),
+        (_DummyExceptedReferenceConvergenceWorkChain, 1),
+        (_DummyExtraReferenceConvergenceWorkChain, 2),
+    ],
+)
+def test_failed_reference_skip_remaining_batches(
+    pseudo_path, process_class, num_references
+):
+    """Test the batches after the first one are not submitted if the reference failed
+    or excepted, and the workchain exits with 401 also when `inspect_reference` is overrided."""
+    _, node = _run_dummy_convergence(
+        process_class,
+        pseudo_path,
+        max_concurrent_evaluations=1,
+    )
+
+    assert (
+        node.exit_status
+        == _DummyConvergenceWorkChain.exit_codes.ERROR_REFERENCE_CALCULATION_FAILED.status
+    )
+    assert node.base.extras.get("batch_sizes") == [1]
+
+    # the references and the first batch
+    evaluations = node.base.links.get_outgoing(node_class=orm.WorkChainNode).all_nodes()
+    assert len(evaluations) == num_references + 1
+
+
 # TODO: test not clean workdir
 # TODO: test validator of _base convergence workchain working as expected
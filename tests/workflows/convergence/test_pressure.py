@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from aiida_sssp_workflow.workflows.convergence.pressure import (
+    _birch_murnaghan_polynomial,
+    _helper_get_volume_from_pressure_birch_murnaghan,
+)
+
+# Birch-Murnaghan parameters of Al, V0 in angs^3 and B0 in eV/angs^3
+V0, B0, B1 = 16.5, 0.48, 4.6
+
+
+def _reference_volume_from_pressure(P, V0, B0, B1):
+    """The reference implementation solving a single pressure with `np.roots`"""
+    P = P / 160.21766208
+    polynomial = [
+        3.0 / 4.0 * (B1 - 4.0),
+        0,
+        1.0 - 3.0 / 2.0 * (B1 - 4.0),
+        0,
+        3.0 / 4.0 * (B1 - 4.0) - 1.0,
+        0,
+        0,
+        0,
+        0,
+        -2 * P / (3.0 * B0),
+    ]
+    V = min(
+        [
+            V0 / (x.real**3)
+            for x in np.roots(polynomial)
+            if abs(x.imag) < 1e-8 * abs(x.real)
+        ],
+        key=lambda V: abs(V - V0) / float(V0),
+    )
+
+    return abs(V - V0) / V0 * 100
+
+
+def test_birch_murnaghan_polynomial():
+    """Test the polynomial is the expanded Birch-Murnaghan pressure in x=(V0/V)^(1/3)"""
+    x = np.linspace(0.9, 1.1, 11)
+    pressure = (
+        3.0 * B0 / 2.0 * (x**7 - x**5) * (1 + 3.0 / 4.0 * (B1 - 4.0) * (x**2 - 1))
+    )
+
+    polynomial = _birch_murnaghan_polynomial(B1)
+
+    assert np.polyval(polynomial, x) == pytest.approx(2.0 / (3.0 * B0) * pressure)
+    assert not polynomial.flags.writeable
+
+
+@pytest.mark.parametrize("P", [0.0, 0.01, -0.5, 1.2, 10.0])
+def test_volume_from_pressure_scalar(P):
+    """Test a single pressure gives the same residual volume as `np.roots`"""
+    got = _helper_get_volume_from_pressure_birch_murnaghan(P, V0, B0, B1)
+
+    assert isinstance(got, float)
+    assert got == pytest.approx(_reference_volume_from_pressure(P, V0, B0, B1))
+
+
+def test_volume_from_pressure_batch():
+    """Test solving a batch of pressures is the same as solving them one by one"""
+    pressures = np.linspace(-2.0, 2.0, 24)
+    got = _helper_get_volume_from_pressure_birch_murnaghan(pressures, V0, B0, B1)
+
+    expected = [_reference_volume_from_pressure(P, V0, B0, B1) for P in pressures]
+
+    assert got.shape == pressures.shape
+    assert got == pytest.approx(expected)
+
+
+def test_volume_from_pressure_samples():
+    """Test solving samples with different EOS parameters in one call, broadcast against the pressures"""
+    pressures = np.linspace(-1.0, 1.0, 5)
+    V0s = np.array([[16.5], [20.4], [11.8]])
+    B0s = np.array([[0.48], [1.1], [0.9]])
+    B1s = np.array([[4.6], [4.3], [5.1]])
+
+    got = _helper_get_volume_from_pressure_birch_murnaghan(pressures, V0s, B0s, B1s)
+
+    expected = [
+        [_reference_volume_from_pressure(P, V0[0], B0[0], B1[0]) for P in pressures]
+        for V0, B0, B1 in zip(V0s, B0s, B1s)
+    ]
+
+    assert got.shape == (3, 5)
+    assert got == pytest.approx(np.array(expected))
+
+
+@pytest.mark.parametrize("P", [0.01, -0.5, 1.0])
+def test_volume_from_pressure_second_order(P):
+    """Test B1=4, where the x^9 coefficient vanishes, gives the same residual volume as `np.roots`"""
+    got = _helper_get_volume_from_pressure_birch_murnaghan(P, V0, B0, 4.0)
+
+    assert got == pytest.approx(_reference_volume_from_pressure(P, V0, B0, 4.0))
+
+
+def test_volume_from_pressure_samples_with_second_order():
+    """Test samples mixing B1=4 and B1!=4 are solved in one call"""
+    pressures = np.array([1.0, 0.5, -0.3])
+    B1s = np.array([4.0, 4.6, 4.0])
+
+    got = _helper_get_volume_from_pressure_birch_murnaghan(pressures, V0, B0, B1s)
+
+    expected = [
+        _reference_volume_from_pressure(P, V0, B0, B1) for P, B1 in zip(pressures, B1s)
+    ]
+
+    assert got == pytest.approx(expected)
@@ -0,0 +1,47 @@
+import pytest
+
+from aiida import orm
+
+from aiida_sssp_workflow.workflows.evaluate._cohesive_energy import (
+    create_isolate_atom,
+    get_isolate_atom_structures,
+    validate_inputs,
+)
+
+
+@pytest.mark.usefixtures("aiida_profile")
+def test_get_isolate_atom_structures():
+    """Test the passed in atom structure is used and the missing element is created"""
+    vacuum_length = orm.Float(10.0).store()
+    atom_structures = {"Al": create_isolate_atom(orm.Str("Al"), vacuum_length)}
+
+    got = get_isolate_atom_structures(["Al", "O"], vacuum_length, atom_structures)
+
+    assert got["Al"].uuid == atom_structures["Al"].uuid
+
+    assert got["O"].creator.process_label == "create_isolate_atom"
+    assert got["O"].get_kind_names() == ["O"]
+    assert got["O"].cell == [[10.0, 0.0, 0.0], [0.0, 10.0, 0.0], [0.0, 0.0, 10.0]]
+
+
+@pytest.mark.usefixtures("aiida_profile")
+@pytest.mark.parametrize(
+    "element,length,valid",
+    [
+        ("Al", 10.0, True),
+        ("Al", 12.0, False),
+        ("O", 10.0, False),
+    ],
+)
+def test_validate_atom_structures(element, length, valid):
+    """Test the atom structures must match the vacuum length and the element"""
+    atom_structure = create_isolate_atom(orm.Str(element), orm.Float(length))
+    inputs = {
+        "vacuum_length": orm.Float(10.0),
+        "atom_structures": {"Al": atom_structure},
+    }
+
+    if valid:
+        assert validate_inputs(inputs) is None
+    else:
+        assert "is not a single Al atom" in validate_inputs(inputs)
@@ -1,5 +1,6 @@
 import pytest
 
+from aiida import orm
 from aiida.engine import ProcessBuilder, run_get_node
 from aiida.plugins import WorkflowFactory
 
@@ -25,8 +26,13 @@ def test_default_builder(pseudo_, code_generator, pseudo_path, data_regression):
         dry_run=True,
     )
 
+    num_lists = orm.QueryBuilder().append(orm.List).count()
+
     result, _ = run_get_node(builder)
 
+    # a single cutoff list node is shared by all the convergence builders
+    assert orm.QueryBuilder().append(orm.List).count() == num_lists + 1
+
     data_regression.check(result["builders"])
 
 